@@ -3,13 +3,40 @@ AI Audit Toolkit - Web Demo
 Run: python3 -m streamlit run app.py
 """
 import streamlit as st
-import json, io
+import io
+from dataclasses import replace
 from datetime import datetime
-from pathlib import Path
-from audit_toolkit import (Client, Opportunity, AuditProject, calculate_audit_roi, generate_interview_doc, generate_opportunity_matrix, generate_executive_report, generate_executive_pptx)
+from audit_toolkit import (Client, Opportunity, AuditProject, calculate_audit_roi, group_by_category, generate_interview_doc, generate_opportunity_matrix, generate_executive_report, generate_executive_pptx, project_to_json)
 
 st.set_page_config(page_title="AI Audit Toolkit - GVRN-AI", page_icon="🎯", layout="wide", initial_sidebar_state="expanded")
 
+# The document generators are pure functions of their inputs, so memoize them across
+# reruns. Keys are plain tuples of the widget/session values so hashing stays cheap and
+# deterministic. Nothing cached reads the clock: dates are passed in, since cache_data
+# entries are shared by every session. Building the project and ROI is cheaper than a
+# cache hit (which unpickles a copy), so those are done directly on every run.
+# max_entries bounds each cache on a long-running server (decks are the largest entries).
+def _build_project(client_key, opps_key, created_date):
+    return AuditProject(client=Client(*client_key), opportunities=[Opportunity(*o) for o in opps_key], created_date=created_date, interviews_completed=8, status="analysis")
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_interview_doc(client_key, today, role_type="both"):
+    return generate_interview_doc(Client(*client_key), role_type=role_type, today=today)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_opportunity_matrix(opps_key):
+    return generate_opportunity_matrix([Opportunity(*o) for o in opps_key])
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_executive_report(client_key, opps_key, roi_data, today):
+    return generate_executive_report(_build_project(client_key, opps_key, today), roi_data, today=today)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def cached_executive_pptx(client_key, opps_key, roi_data, cover_date):
+    buf = io.BytesIO()
+    generate_executive_pptx(_build_project(client_key, opps_key, cover_date.isoformat()), roi_data, buf, cover_date=cover_date)
+    return buf.getvalue()
+
 with st.sidebar:
     st.markdown("### Client Information")
     company_name = st.text_input("Company Name", value="Maplewood Residential Aged Care")
@@ -34,9 +61,13 @@ if load_example or (not st.session_state.opportunities):
         {"name":"Staff Rostering Optimisation","description":"Manual roster creation in spreadsheets; difficulty balancing care minute targets and award conditions","hours_saved_weekly":5.0,"employees_affected":2,"effort":"low","impact":"low"},
     ]
 
-client = Client(company_name=company_name, industry=industry, employee_count=employee_count, contact_name=contact_name, contact_email=contact_email, avg_salary=avg_salary)
-opportunities = [Opportunity(name=o["name"],description=o["description"],hours_saved_weekly=o["hours_saved_weekly"],employees_affected=o["employees_affected"],effort=o["effort"],impact=o["impact"]) for o in st.session_state.opportunities]
-project = AuditProject(client=client, opportunities=opportunities, created_date=datetime.now().isoformat(), interviews_completed=8, status="analysis")
+now = datetime.now()
+today = now.strftime("%Y-%m-%d")
+client_key = (company_name, industry, employee_count, contact_name, contact_email, avg_salary)
+opps_key = tuple((o["name"],o["description"],o["hours_saved_weekly"],o["employees_affected"],o["effort"],o["impact"]) for o in st.session_state.opportunities)
+project = _build_project(client_key, opps_key, today)
+client, opportunities = project.client, project.opportunities
+buckets = group_by_category(opportunities)
 roi_data = calculate_audit_roi(opportunities, avg_salary, implementation_cost)
 
 st.markdown("# AI Audit Toolkit")
@@ -44,13 +75,15 @@ st.markdown(f"**{company_name}** - {industry.replace('_',' ').title()} | {employ
 
 tab1, tab2, tab3, tab4 = st.tabs(["Dashboard","Opportunities","Interview Questions","Downloads"])
 
-with tab1:
+# Each tab is a fragment, so widgets inside one tab (e.g. the question-set radio or a
+# download click) only rerun that tab instead of the whole script.
+@st.fragment
+def _render_dashboard():
     st.markdown("## Executive Summary")
     combined = roi_data["combined"]
     c1,c2,c3,c4 = st.columns(4)
     c1.metric("Opportunities", len(opportunities))
-    quick_wins = [o for o in opportunities if o.category == "quick_win"]
-    c2.metric("Quick Wins", len(quick_wins))
+    c2.metric("Quick Wins", len(buckets["quick_win"]))
     c3.metric("Hours Saved/Week", f"{combined['hours_saved_weekly']:.0f}")
     c4.metric("Total Annual Value", f"${combined['total_annual_value']:,.0f}")
     st.markdown("---")
@@ -61,14 +94,18 @@ with tab1:
     st.markdown("---")
     st.markdown("### Opportunity Matrix")
     for cat_name, cat_key in [("Quick Wins","quick_win"),("Big Swings","big_swing"),("Nice-to-Haves","nice_to_have")]:
-        cat_opps = [o for o in opportunities if o.category == cat_key]
+        cat_opps = buckets[cat_key]
         if cat_opps:
             with st.expander(f"{cat_name} ({len(cat_opps)})", expanded=(cat_key=="quick_win")):
                 for opp in cat_opps:
-                    st.markdown(f"**{opp.name}** - {opp.hours_saved_weekly * opp.employees_affected:.0f} hrs/week saved")
+                    st.markdown(f"**{opp.name}** - {opp.total_weekly_hours:.0f} hrs/week saved")
                     st.caption(opp.description)
 
-with tab2:
+with tab1:
+    _render_dashboard()
+
+@st.fragment
+def _render_opportunities():
     st.markdown("## Identified Opportunities")
     for i, opp_data in enumerate(st.session_state.opportunities):
         with st.expander(f"{i+1}. {opp_data['name']} - {opp_data['effort'].upper()}/{opp_data['impact'].upper()}"):
@@ -88,28 +125,41 @@ with tab2:
             st.session_state.opportunities.append({"name":nn,"description":nd,"hours_saved_weekly":nh,"employees_affected":ne,"effort":nef,"impact":ni})
             st.rerun()
 
-with tab3:
+with tab2:
+    _render_opportunities()
+
+@st.fragment
+def _render_interview_questions():
     st.markdown("## Interview Questions")
     st.markdown(f"Tailored for **{industry.replace('_',' ').title()}**")
     role = st.radio("Set",["Both","Stakeholder","End-User"],horizontal=True)
     rm = {"Both":"both","Stakeholder":"stakeholder","End-User":"enduser"}
-    st.markdown(generate_interview_doc(client, role_type=rm[role]))
+    st.markdown(cached_interview_doc(client_key, today, role_type=rm[role]))
 
-with tab4:
+with tab3:
+    _render_interview_questions()
+
+@st.fragment
+def _render_downloads():
     st.markdown("## Download Deliverables")
     c1,c2 = st.columns(2)
     with c1:
-        st.download_button("Interview Questions (.md)", data=generate_interview_doc(client), file_name="interview_questions.md", mime="text/markdown", use_container_width=True)
-        st.download_button("Opportunity Matrix (.md)", data=generate_opportunity_matrix(opportunities), file_name="opportunity_matrix.md", mime="text/markdown", use_container_width=True)
+        st.download_button("Interview Questions (.md)", data=cached_interview_doc(client_key, today), file_name="interview_questions.md", mime="text/markdown", use_container_width=True)
+        st.download_button("Opportunity Matrix (.md)", data=cached_opportunity_matrix(opps_key), file_name="opportunity_matrix.md", mime="text/markdown", use_container_width=True)
     with c2:
-        st.download_button("Executive Report (.md)", data=generate_executive_report(project, roi_data), file_name="executive_report.md", mime="text/markdown", use_container_width=True)
-        tmp = Path("/tmp/pres.pptx")
-        generate_executive_pptx(project, roi_data, tmp)
-        with open(tmp,"rb") as f:
-            st.download_button("Executive PPTX", data=f.read(), file_name="executive_presentation.pptx", mime="application/vnd.openxmlformats-officedocument.presentationml.presentation", use_container_width=True)
+        st.download_button("Executive Report (.md)", data=cached_executive_report(client_key, opps_key, roi_data, today), file_name="executive_report.md", mime="text/markdown", use_container_width=True)
+        # Building the deck is the expensive step, so only do it on request and
+        # ask again whenever the inputs change.
+        pptx_inputs = (client_key, opps_key, roi_data, now.date())
+        if st.session_state.get("pptx_inputs") != pptx_inputs:
+            st.button("Prepare Executive PPTX", on_click=lambda: st.session_state.update(pptx_inputs=pptx_inputs), use_container_width=True)
+        else:
+            st.download_button("Executive PPTX", data=cached_executive_pptx(*pptx_inputs), file_name="executive_presentation.pptx", mime="application/vnd.openxmlformats-officedocument.presentationml.presentation", use_container_width=True)
     st.markdown("---")
-    from dataclasses import asdict
-    st.download_button("Project JSON", data=json.dumps(asdict(project),indent=2), file_name="audit_project.json", mime="application/json", use_container_width=True)
+    st.download_button("Project JSON", data=project_to_json(replace(project, created_date=now.isoformat())), file_name="audit_project.json", mime="application/json", use_container_width=True)
+
+with tab4:
+    _render_downloads()
 
 st.markdown("---")
 st.caption("Built by GVRN-AI | AI Audit & Automation Services | github.com/CloudAIX/ai-audit-toolkit")
@@ -4,29 +4,34 @@ AI Audit Toolkit
 Run professional AI audits for clients ($10K engagement framework).
 
 Usage:
-    python audit_toolkit.py --new-audit          # Start new audit project
-    python audit_toolkit.py --questions          # Generate interview questions
-    python audit_toolkit.py --roi                # Calculate ROI
-    python audit_toolkit.py --report             # Generate audit report
+    python audit_toolkit.py example                       # Generate a demo audit
+    python audit_toolkit.py new-audit                     # Start new audit project
+    python audit_toolkit.py new-audit --batch-input FILE  # New project from a JSON intake form
+    python audit_toolkit.py questions -p FILE             # Generate interview questions
+    python audit_toolkit.py roi -p FILE                   # Calculate ROI
+    python audit_toolkit.py report -p FILE                # Generate audit report
 """
 
 import argparse
+import gzip
 import json
-from datetime import datetime
+import sys
+from datetime import date, datetime
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import BinaryIO, Dict, List, Optional, Union
 
-from pptx import Presentation
-from pptx.util import Inches, Pt, Emu
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+try:
+    import orjson  # optional: much faster project (de)serialization
+except ImportError:
+    orjson = None
 
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Client:
     company_name: str
     industry: str
@@ -35,7 +40,28 @@ class Client:
     contact_email: str
     avg_salary: float = 65000  # Annual average
 
-@dataclass
+    def to_dict(self) -> dict:
+        return {
+            "company_name": self.company_name,
+            "industry": self.industry,
+            "employee_count": self.employee_count,
+            "contact_name": self.contact_name,
+            "contact_email": self.contact_email,
+            "avg_salary": self.avg_salary,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Client":
+        return cls(**{**data, "industry": sys.intern(data["industry"])})
+
+# (effort, impact) -> matrix quadrant; anything else is deprioritized
+_CATEGORY_TABLE = {
+    ("low", "high"): "quick_win",
+    ("high", "high"): "big_swing",
+    ("low", "low"): "nice_to_have",
+}
+
+@dataclass(slots=True, frozen=True)
 class Opportunity:
     name: str
     description: str
@@ -46,18 +72,38 @@ class Opportunity:
     category: str = ""  # quick_win, big_swing, nice_to_have, deprioritize
 
     def __post_init__(self):
-        # Auto-categorize based on effort/impact
+        # Auto-categorize based on effort/impact (frozen, so bypass __setattr__)
         if not self.category:
-            if self.effort == "low" and self.impact == "high":
-                self.category = "quick_win"
-            elif self.effort == "high" and self.impact == "high":
-                self.category = "big_swing"
-            elif self.effort == "low" and self.impact == "low":
-                self.category = "nice_to_have"
-            else:
-                self.category = "deprioritize"
-
-@dataclass
+            object.__setattr__(self, "category",
+                               _CATEGORY_TABLE.get((self.effort, self.impact), "deprioritize"))
+
+    @property
+    def total_weekly_hours(self) -> float:
+        """Hours saved per week across all affected employees."""
+        return self.hours_saved_weekly * self.employees_affected
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "hours_saved_weekly": self.hours_saved_weekly,
+            "employees_affected": self.employees_affected,
+            "effort": self.effort,
+            "impact": self.impact,
+            "category": self.category,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Opportunity":
+        # Saved projects carry their category, so __post_init__ skips the lookup.
+        # The low-cardinality enum strings are interned so every loaded opportunity
+        # shares one object per value and comparisons/dict lookups hit identity first.
+        data = {**data, "effort": sys.intern(data["effort"]), "impact": sys.intern(data["impact"])}
+        if data.get("category"):
+            data["category"] = sys.intern(data["category"])
+        return cls(**data)
+
+@dataclass(slots=True)
 class AuditProject:
     client: Client
     opportunities: List[Opportunity]
@@ -65,6 +111,35 @@ class AuditProject:
     interviews_completed: int = 0
     status: str = "discovery"  # discovery, analysis, presentation
 
+    def to_dict(self) -> dict:
+        # Plain dict literals instead of dataclasses.asdict(), which deep-copies every field
+        return {
+            "client": self.client.to_dict(),
+            "opportunities": [o.to_dict() for o in self.opportunities],
+            "created_date": self.created_date,
+            "interviews_completed": self.interviews_completed,
+            "status": self.status,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AuditProject":
+        return cls(
+            client=Client.from_dict(data["client"]),
+            opportunities=[Opportunity.from_dict(o) for o in data["opportunities"]],
+            created_date=data["created_date"],
+            interviews_completed=data.get("interviews_completed", 0),
+            status=sys.intern(data.get("status", "discovery"))
+        )
+
+CATEGORIES = ("quick_win", "big_swing", "nice_to_have", "deprioritize")
+
+def group_by_category(opportunities: List[Opportunity]) -> Dict[str, List[Opportunity]]:
+    """Bucket opportunities by matrix quadrant in a single pass."""
+    buckets = {cat: [] for cat in CATEGORIES}
+    for opp in opportunities:
+        buckets.setdefault(opp.category, []).append(opp)
+    return buckets
+
 # ============================================================================
 # INTERVIEW QUESTION TEMPLATES
 # ============================================================================
@@ -164,6 +239,50 @@ INDUSTRY_SPECIFIC = {
     ]
 }
 
+
+def _render_question_sections(sections: dict) -> str:
+    """Render a {section: [questions]} mapping as Markdown subsections."""
+    return "".join(
+        f"### {section.replace('_', ' ').title()}\n\n"
+        + "".join(f"- {q}\n" for q in questions)
+        + "\n"
+        for section, questions in sections.items()
+    )
+
+
+@lru_cache(maxsize=64)
+def _industry_key(industry: str) -> str:
+    """Normalize a free-text industry name (e.g. "Aged Care") to its question-bank key."""
+    return industry.lower().replace(" ", "_")
+
+# The question banks are constant, so render them once at import time
+_STAKEHOLDER_MD = _render_question_sections(STAKEHOLDER_QUESTIONS)
+_ENDUSER_MD = _render_question_sections(ENDUSER_QUESTIONS)
+_INDUSTRY_MD = {
+    industry: f"## {industry.replace('_', ' ').title()} Industry-Specific Questions\n\n"
+              + "".join(f"- {q}\n" for q in questions)
+              + "\n"
+    for industry, questions in INDUSTRY_SPECIFIC.items()
+}
+
+_INTERVIEW_FOOTER = """---
+
+## Interview Best Practices
+
+- **Listen 80%, Talk 20%** — get them talking
+- **Ask "Why?" repeatedly** — get to root causes
+- **Record with permission** — use Fireflies.ai for transcription
+- **Focus on problems, not solutions** — save solutions for later
+- **Note emotional reactions** — frustration = opportunity
+
+## After Each Interview
+
+1. [ ] Transcription saved
+2. [ ] Key pain points highlighted
+3. [ ] Time estimates noted (hours/week on tasks)
+4. [ ] Follow-up questions documented
+"""
+
 # ============================================================================
 # ROI CALCULATOR
 # ============================================================================
@@ -215,8 +334,19 @@ def calculate_roi(
 def calculate_audit_roi(opportunities: List[Opportunity], avg_salary: float, implementation_cost: float) -> dict:
     """Calculate combined ROI for all opportunities."""
 
-    total_hours = sum(o.hours_saved_weekly * o.employees_affected for o in opportunities)
-    total_employees = sum(o.employees_affected for o in opportunities)
+    # Accumulate overall and per-category (hours, employees) in a single pass
+    total_hours = 0
+    total_employees = 0
+    cat_totals = {}
+    for o in opportunities:
+        hours, employees = o.total_weekly_hours, o.employees_affected
+        total_hours += hours
+        total_employees += employees
+        cat = cat_totals.get(o.category)
+        if cat is None:
+            cat = cat_totals[o.category] = [0, 0]
+        cat[0] += hours
+        cat[1] += employees
 
     combined = calculate_roi(
         hours_saved_weekly=total_hours / max(total_employees, 1),
@@ -227,11 +357,9 @@ def calculate_audit_roi(opportunities: List[Opportunity], avg_salary: float, imp
 
     # By category
     by_category = {}
-    for cat in ["quick_win", "big_swing", "nice_to_have", "deprioritize"]:
-        cat_opps = [o for o in opportunities if o.category == cat]
-        if cat_opps:
-            cat_hours = sum(o.hours_saved_weekly * o.employees_affected for o in cat_opps)
-            cat_employees = sum(o.employees_affected for o in cat_opps)
+    for cat in CATEGORIES:
+        if cat in cat_totals:
+            cat_hours, cat_employees = cat_totals[cat]
             by_category[cat] = calculate_roi(
                 hours_saved_weekly=cat_hours / max(cat_employees, 1),
                 employees_affected=cat_employees,
@@ -248,18 +376,13 @@ def calculate_audit_roi(opportunities: List[Opportunity], avg_salary: float, imp
 # REPORT GENERATOR
 # ============================================================================
 
-def generate_interview_doc(client: Client, role_type: str = "both") -> str:
-    """Generate interview questions document for a client."""
+_INTERVIEW_HEADER_TMPL = """# AI Audit Interview Questions
+## {company_name}
 
-    industry = client.industry.lower().replace(" ", "_")
-
-    doc = f"""# AI Audit Interview Questions
-## {client.company_name}
-
-**Prepared for**: {client.contact_name}
-**Date**: {datetime.now().strftime("%Y-%m-%d")}
-**Industry**: {client.industry}
-**Employee Count**: {client.employee_count}
+**Prepared for**: {contact_name}
+**Date**: {today}
+**Industry**: {industry}
+**Employee Count**: {employee_count}
 
 ---
 
@@ -267,7 +390,7 @@ def generate_interview_doc(client: Client, role_type: str = "both") -> str:
 
 | Business Size | Recommended Interviews | Duration |
 |---------------|------------------------|----------|
-| {client.employee_count} employees | {"3-5" if client.employee_count < 50 else "10-15"} interviews | 30-45 min each |
+| {employee_count} employees | {interview_count} interviews | 30-45 min each |
 
 **Target mix**:
 - 40% Leadership/Stakeholders (understand goals)
@@ -277,55 +400,58 @@ def generate_interview_doc(client: Client, role_type: str = "both") -> str:
 
 """
 
-    if role_type in ["both", "stakeholder"]:
-        doc += "## Stakeholder Interview Questions (30,000-Foot View)\n\n"
-        for section, questions in STAKEHOLDER_QUESTIONS.items():
-            doc += f"### {section.replace('_', ' ').title()}\n\n"
-            for q in questions:
-                doc += f"- {q}\n"
-            doc += "\n"
 
-    if role_type in ["both", "enduser"]:
-        doc += "## End-User Interview Questions (On-the-Ground Reality)\n\n"
-        for section, questions in ENDUSER_QUESTIONS.items():
-            doc += f"### {section.replace('_', ' ').title()}\n\n"
-            for q in questions:
-                doc += f"- {q}\n"
-            doc += "\n"
+def generate_interview_doc(client: Client, role_type: str = "both",
+                           today: Optional[str] = None) -> str:
+    """Generate interview questions document for a client.
 
-    # Add industry-specific questions
-    if industry in INDUSTRY_SPECIFIC:
-        industry_display = client.industry.replace("_", " ").title()
-        doc += f"## {industry_display} Industry-Specific Questions\n\n"
-        for q in INDUSTRY_SPECIFIC[industry]:
-            doc += f"- {q}\n"
-        doc += "\n"
+    `today` is the YYYY-MM-DD date stamped on the document (defaults to now).
+    """
 
-    doc += """---
+    today = today or datetime.now().strftime("%Y-%m-%d")
 
-## Interview Best Practices
+    header = _INTERVIEW_HEADER_TMPL.format_map({
+        "company_name": client.company_name,
+        "contact_name": client.contact_name,
+        "today": today,
+        "industry": client.industry,
+        "employee_count": client.employee_count,
+        "interview_count": "3-5" if client.employee_count < 50 else "10-15",
+    })
 
-- **Listen 80%, Talk 20%** — get them talking
-- **Ask "Why?" repeatedly** — get to root causes
-- **Record with permission** — use Fireflies.ai for transcription
-- **Focus on problems, not solutions** — save solutions for later
-- **Note emotional reactions** — frustration = opportunity
+    return header + _interview_body(_industry_key(client.industry), role_type)
 
-## After Each Interview
 
-1. [ ] Transcription saved
-2. [ ] Key pain points highlighted
-3. [ ] Time estimates noted (hours/week on tasks)
-4. [ ] Follow-up questions documented
-"""
+@lru_cache(maxsize=32)
+def _interview_body(industry: str, role_type: str) -> str:
+    """Question sections and footer of the interview doc; depends only on its arguments."""
 
-    return doc
+    parts = []
 
+    if role_type in ["both", "stakeholder"]:
+        parts.append("## Stakeholder Interview Questions (30,000-Foot View)\n\n")
+        parts.append(_STAKEHOLDER_MD)
 
-def generate_opportunity_matrix(opportunities: List[Opportunity]) -> str:
-    """Generate opportunity matrix visualization."""
+    if role_type in ["both", "enduser"]:
+        parts.append("## End-User Interview Questions (On-the-Ground Reality)\n\n")
+        parts.append(_ENDUSER_MD)
+
+    # Add industry-specific questions
+    parts.append(_INDUSTRY_MD.get(industry, ""))
+    parts.append(_INTERVIEW_FOOTER)
+
+    return "".join(parts)
+
+
+# Matrix sections in render order: (category, heading)
+_MATRIX_SECTIONS = (
+    ("quick_win", "🎯 Quick Wins (Low Effort, High Impact)"),
+    ("big_swing", "🚀 Big Swings (High Effort, High Impact)"),
+    ("nice_to_have", "✨ Nice-to-Haves (Low Effort, Low Impact)"),
+    ("deprioritize", "⏸️ Deprioritize (High Effort, Low Impact)"),
+)
 
-    matrix = """# AI Opportunity Matrix
+_MATRIX_HEADER = """# AI Opportunity Matrix
 
 ## Quick Reference
 
@@ -342,63 +468,54 @@ def generate_opportunity_matrix(opportunities: List[Opportunity]) -> str:
 
 """
 
-    categories = {
-        "quick_win": ("🎯 Quick Wins (Low Effort, High Impact)", []),
-        "big_swing": ("🚀 Big Swings (High Effort, High Impact)", []),
-        "nice_to_have": ("✨ Nice-to-Haves (Low Effort, Low Impact)", []),
-        "deprioritize": ("⏸️ Deprioritize (High Effort, Low Impact)", [])
-    }
-
-    for opp in opportunities:
-        categories[opp.category][1].append(opp)
-
-    for cat_id, (cat_name, opps) in categories.items():
-        if opps:
-            matrix += f"### {cat_name}\n\n"
-            for opp in opps:
-                matrix += f"**{opp.name}**\n"
-                matrix += f"- {opp.description}\n"
-                matrix += f"- Hours saved: {opp.hours_saved_weekly}/week × {opp.employees_affected} employees\n"
-                matrix += f"- Effort: {opp.effort.upper()} | Impact: {opp.impact.upper()}\n\n"
 
-    return matrix
+def generate_opportunity_matrix(opportunities: List[Opportunity]) -> str:
+    """Generate opportunity matrix visualization."""
 
+    parts = [_MATRIX_HEADER]
 
-def generate_executive_report(project: AuditProject, roi_data: dict) -> str:
-    """Generate executive summary report."""
+    buckets = group_by_category(opportunities)
 
-    client = project.client
-    opportunities = project.opportunities
+    for cat_id, cat_name in _MATRIX_SECTIONS:
+        opps = buckets[cat_id]
+        if opps:
+            parts.append(f"### {cat_name}\n\n")
+            for opp in opps:
+                parts.append(
+                    f"**{opp.name}**\n"
+                    f"- {opp.description}\n"
+                    f"- Hours saved: {opp.hours_saved_weekly}/week × {opp.employees_affected} employees\n"
+                    f"- Effort: {opp.effort.upper()} | Impact: {opp.impact.upper()}\n\n"
+                )
 
-    quick_wins = [o for o in opportunities if o.category == "quick_win"]
-    big_swings = [o for o in opportunities if o.category == "big_swing"]
+    return "".join(parts)
 
-    report = f"""# AI Audit Report
-## {client.company_name}
+_REPORT_HEADER_TMPL = """# AI Audit Report
+## {company_name}
 
 **Prepared by**: GVRN-AI
-**Date**: {datetime.now().strftime("%Y-%m-%d")}
+**Date**: {today}
 **Engagement**: AI Opportunity Assessment
 
 ---
 
 ## Executive Summary
 
-Following {project.interviews_completed} discovery interviews across {client.company_name},
-we identified **{len(opportunities)} AI automation opportunities** with potential annual
-value of **${roi_data['combined']['total_annual_value']:,.0f}**.
+Following {interviews_completed} discovery interviews across {company_name},
+we identified **{opportunity_count} AI automation opportunities** with potential annual
+value of **${total_annual_value:,.0f}**.
 
 ### Key Findings
 
 | Metric | Value |
 |--------|-------|
-| Total Opportunities Identified | {len(opportunities)} |
-| Quick Wins (Start Immediately) | {len(quick_wins)} |
-| Strategic Initiatives | {len(big_swings)} |
-| Estimated Hours Saved Weekly | {roi_data['combined']['hours_saved_weekly']:.0f} |
-| Annual Cost Savings | ${roi_data['combined']['annual_savings']:,.0f} |
-| Annual Revenue Potential | ${roi_data['combined']['annual_revenue_potential']:,.0f} |
-| **Total Annual Value** | **${roi_data['combined']['total_annual_value']:,.0f}** |
+| Total Opportunities Identified | {opportunity_count} |
+| Quick Wins (Start Immediately) | {quick_win_count} |
+| Strategic Initiatives | {big_swing_count} |
+| Estimated Hours Saved Weekly | {hours_saved_weekly:.0f} |
+| Annual Cost Savings | ${annual_savings:,.0f} |
+| Annual Revenue Potential | ${annual_revenue_potential:,.0f} |
+| **Total Annual Value** | **${total_annual_value:,.0f}** |
 
 ---
 
@@ -408,37 +525,17 @@ value of **${roi_data['combined']['total_annual_value']:,.0f}**.
 
 """
 
-    for i, opp in enumerate(quick_wins[:3], 1):
-        report += f"""#### {i}. {opp.name}
-
-- **Current State**: {opp.description}
-- **Time Impact**: {opp.hours_saved_weekly} hours/week × {opp.employees_affected} people
-- **Implementation**: 1-2 weeks
-
-"""
-
-    if big_swings:
-        report += "### Phase 2: Strategic Initiatives (Months 2-6)\n\n"
-        for i, opp in enumerate(big_swings[:3], 1):
-            report += f"""#### {i}. {opp.name}
-
-- **Current State**: {opp.description}
-- **Time Impact**: {opp.hours_saved_weekly} hours/week × {opp.employees_affected} people
-- **Implementation**: 4-8 weeks
-
-"""
-
-    report += f"""---
+_REPORT_ROI_TMPL = """---
 
 ## ROI Analysis
 
 ### Cost Savings Calculation
 
 ```
-Hours Saved/Week:     {roi_data['combined']['hours_saved_weekly']:.0f} hours
-Average Hourly Rate:  ${roi_data['combined']['hourly_rate']:.2f}
-Weekly Savings:       ${roi_data['combined']['weekly_savings']:,.0f}
-Annual Savings:       ${roi_data['combined']['annual_savings']:,.0f}
+Hours Saved/Week:     {hours_saved_weekly:.0f} hours
+Average Hourly Rate:  ${hourly_rate:.2f}
+Weekly Savings:       ${weekly_savings:,.0f}
+Annual Savings:       ${annual_savings:,.0f}
 ```
 
 ### Revenue Potential
@@ -446,20 +543,22 @@ Annual Savings:       ${roi_data['combined']['annual_savings']:,.0f}
 Assuming 50% of saved time is redirected to revenue-generating activities:
 
 ```
-Annual Revenue Potential: ${roi_data['combined']['annual_revenue_potential']:,.0f}
+Annual Revenue Potential: ${annual_revenue_potential:,.0f}
 ```
 
 ### Investment Summary
 
 | Metric | Value |
 |--------|-------|
-| Estimated Implementation Cost | ${roi_data['combined']['implementation_cost']:,.0f} |
-| Payback Period | {roi_data['combined']['payback_months']:.1f} months |
-| First Year ROI | {roi_data['combined']['roi_percentage']:.0f}% |
+| Estimated Implementation Cost | ${implementation_cost:,.0f} |
+| Payback Period | {payback_months:.1f} months |
+| First Year ROI | {roi_percentage:.0f}% |
 
 ---
 
-## Next Steps
+"""
+
+_REPORT_FOOTER = """## Next Steps
 
 1. **Approve Phase 1 Quick Wins** — Start with highest-impact, lowest-effort items
 2. **Schedule kickoff meeting** — Align team and set success metrics
@@ -471,343 +570,81 @@ Annual Revenue Potential: ${roi_data['combined']['annual_revenue_potential']:,.0
 *Contact: [your-email@gvrn-ai.com]*
 """
 
-    return report
 
+def _phase_sections(opportunities: List[Opportunity], implementation: str):
+    """Yield the numbered roadmap entries for one phase of the report."""
+    for i, opp in enumerate(opportunities, 1):
+        yield (
+            f"#### {i}. {opp.name}\n\n"
+            f"- **Current State**: {opp.description}\n"
+            f"- **Time Impact**: {opp.hours_saved_weekly} hours/week × {opp.employees_affected} people\n"
+            f"- **Implementation**: {implementation}\n\n"
+        )
 
-# ============================================================================
-# POWERPOINT REPORT GENERATOR
-# ============================================================================
-
-# Brand colours
-_DARK_BG     = RGBColor(0x1A, 0x1A, 0x2E)   # deep navy
-_GREEN_ACC   = RGBColor(0x00, 0xC9, 0x7B)   # GVRN green
-_WHITE       = RGBColor(0xFF, 0xFF, 0xFF)
-_LIGHT_GREY  = RGBColor(0xCC, 0xCC, 0xCC)
-_MID_GREY    = RGBColor(0x88, 0x88, 0x88)
-_TABLE_ROW1  = RGBColor(0x22, 0x22, 0x3A)   # table odd-row
-_TABLE_ROW2  = RGBColor(0x2A, 0x2A, 0x44)   # table even-row
-
-SLIDE_W = Inches(13.333)
-SLIDE_H = Inches(7.5)
-
-
-def _set_slide_bg(slide, colour=_DARK_BG):
-    bg = slide.background
-    fill = bg.fill
-    fill.solid()
-    fill.fore_color.rgb = colour
-
-
-def _add_textbox(slide, left, top, width, height, text,
-                 font_size=18, colour=_WHITE, bold=False,
-                 alignment=PP_ALIGN.LEFT):
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(font_size)
-    p.font.color.rgb = colour
-    p.font.bold = bold
-    p.alignment = alignment
-    return tf
-
-
-def _add_table(slide, rows_data, left, top, width, col_widths,
-               header_colour=_GREEN_ACC, row_font_size=14):
-    """Add a styled table to a slide. rows_data = list of tuples."""
-    rows = len(rows_data)
-    cols = len(rows_data[0]) if rows_data else 2
-    table_shape = slide.shapes.add_table(rows, cols, left, top, width,
-                                          Emu(rows * Pt(row_font_size + 18).emu))
-    table = table_shape.table
-
-    # Set column widths
-    for i, cw in enumerate(col_widths):
-        table.columns[i].width = cw
-
-    for r_idx, row_vals in enumerate(rows_data):
-        for c_idx, val in enumerate(row_vals):
-            cell = table.cell(r_idx, c_idx)
-            cell.text = str(val)
-            # Cell fill
-            cell_fill = cell.fill
-            cell_fill.solid()
-            if r_idx == 0:
-                cell_fill.fore_color.rgb = _DARK_BG
-            else:
-                cell_fill.fore_color.rgb = _TABLE_ROW1 if r_idx % 2 == 1 else _TABLE_ROW2
-
-            for paragraph in cell.text_frame.paragraphs:
-                paragraph.font.size = Pt(row_font_size)
-                paragraph.font.color.rgb = header_colour if r_idx == 0 else _WHITE
-                paragraph.font.bold = r_idx == 0
-                paragraph.alignment = PP_ALIGN.LEFT if c_idx == 0 else PP_ALIGN.RIGHT
-
-    # Remove table borders for a cleaner look via XML
-    from pptx.oxml.ns import qn
-    for r_idx in range(rows):
-        for c_idx in range(cols):
-            cell = table.cell(r_idx, c_idx)
-            tc = cell._tc
-            tcPr = tc.get_or_add_tcPr()
-            for border_tag in ("a:lnL", "a:lnR", "a:lnT", "a:lnB"):
-                ln = tcPr.find(qn(border_tag))
-                if ln is not None:
-                    tcPr.remove(ln)
-                from lxml import etree
-                ln_el = etree.SubElement(tcPr, qn(border_tag), w="0", cap="flat")
-                etree.SubElement(ln_el, qn("a:noFill"))
-
-    return table
-
-
-def _slide_title_bar(slide, title_text, subtitle_text=None):
-    """Add a thin green accent line + title at the top of a content slide."""
-    # Green accent line
-    from pptx.enum.shapes import MSO_SHAPE
-    line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                                   Inches(0.6), Inches(0.5),
-                                   Inches(0.08), Inches(0.55))
-    line.fill.solid()
-    line.fill.fore_color.rgb = _GREEN_ACC
-    line.line.fill.background()
-
-    _add_textbox(slide, Inches(0.9), Inches(0.4), Inches(10), Inches(0.55),
-                 title_text, font_size=28, colour=_WHITE, bold=True)
-    if subtitle_text:
-        _add_textbox(slide, Inches(0.9), Inches(0.95), Inches(10), Inches(0.4),
-                     subtitle_text, font_size=14, colour=_LIGHT_GREY)
 
+def generate_executive_report(project: AuditProject, roi_data: dict,
+                              today: Optional[str] = None) -> str:
+    """Generate executive summary report.
 
-def generate_executive_pptx(project: AuditProject, roi_data: dict,
-                            output_path: Path) -> Path:
-    """Generate a branded executive PowerPoint presentation."""
+    `today` is the YYYY-MM-DD date stamped on the report (defaults to now).
+    """
 
+    today = today or datetime.now().strftime("%Y-%m-%d")
     client = project.client
     opportunities = project.opportunities
-    quick_wins = [o for o in opportunities if o.category == "quick_win"]
-    big_swings = [o for o in opportunities if o.category == "big_swing"]
-
-    prs = Presentation()
-    prs.slide_width = SLIDE_W
-    prs.slide_height = SLIDE_H
-    blank_layout = prs.slide_layouts[6]  # blank
-
-    # ------------------------------------------------------------------
-    # SLIDE 1: Cover
-    # ------------------------------------------------------------------
-    slide = prs.slides.add_slide(blank_layout)
-    _set_slide_bg(slide)
-
-    # Green accent bar at top
-    from pptx.enum.shapes import MSO_SHAPE
-    bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                                  Inches(0), Inches(0),
-                                  SLIDE_W, Inches(0.08))
-    bar.fill.solid()
-    bar.fill.fore_color.rgb = _GREEN_ACC
-    bar.line.fill.background()
-
-    _add_textbox(slide, Inches(0.8), Inches(1.8), Inches(11), Inches(0.9),
-                 "GVRN-AI", font_size=20, colour=_GREEN_ACC, bold=True)
-    _add_textbox(slide, Inches(0.8), Inches(2.5), Inches(11), Inches(1.0),
-                 "AI Opportunity Assessment", font_size=40, colour=_WHITE, bold=True)
-    _add_textbox(slide, Inches(0.8), Inches(3.6), Inches(11), Inches(0.7),
-                 client.company_name, font_size=28, colour=_LIGHT_GREY)
-
-    date_str = datetime.now().strftime("%B %Y")
-    _add_textbox(slide, Inches(0.8), Inches(5.0), Inches(11), Inches(0.5),
-                 f"Prepared for {client.contact_name}  |  {date_str}",
-                 font_size=14, colour=_MID_GREY)
-
-    # Bottom green bar
-    bar2 = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                                   Inches(0), SLIDE_H - Inches(0.08),
-                                   SLIDE_W, Inches(0.08))
-    bar2.fill.solid()
-    bar2.fill.fore_color.rgb = _GREEN_ACC
-    bar2.line.fill.background()
-
-    # ------------------------------------------------------------------
-    # SLIDE 2: Executive Summary
-    # ------------------------------------------------------------------
-    slide = prs.slides.add_slide(blank_layout)
-    _set_slide_bg(slide)
-    _slide_title_bar(slide, "Executive Summary",
-                     f"Based on {project.interviews_completed} discovery interviews")
-
-    combined = roi_data["combined"]
-    summary_rows = [
-        ("Metric", "Value"),
-        ("Total Opportunities Identified", str(len(opportunities))),
-        ("Quick Wins (Start Immediately)", str(len(quick_wins))),
-        ("Strategic Initiatives", str(len(big_swings))),
-        ("Estimated Hours Saved / Week", f"{combined['hours_saved_weekly']:.0f} hrs"),
-        ("Annual Cost Savings", f"${combined['annual_savings']:,.0f}"),
-        ("Annual Revenue Potential", f"${combined['annual_revenue_potential']:,.0f}"),
-        ("Total Annual Value", f"${combined['total_annual_value']:,.0f}"),
-    ]
 
-    _add_table(slide, summary_rows,
-               left=Inches(0.8), top=Inches(1.6),
-               width=Inches(8), col_widths=[Inches(5), Inches(3)],
-               row_font_size=15)
-
-    # Callout box on the right
-    _add_textbox(slide, Inches(9.3), Inches(2.0), Inches(3.5), Inches(0.4),
-                 "TOTAL ANNUAL VALUE", font_size=13, colour=_GREEN_ACC, bold=True,
-                 alignment=PP_ALIGN.CENTER)
-    _add_textbox(slide, Inches(9.3), Inches(2.5), Inches(3.5), Inches(0.7),
-                 f"${combined['total_annual_value']:,.0f}",
-                 font_size=36, colour=_WHITE, bold=True,
-                 alignment=PP_ALIGN.CENTER)
-    _add_textbox(slide, Inches(9.3), Inches(3.3), Inches(3.5), Inches(0.4),
-                 f"ROI {combined['roi_percentage']:.0f}%  |  Payback {combined['payback_months']:.1f} mo",
-                 font_size=13, colour=_LIGHT_GREY, alignment=PP_ALIGN.CENTER)
-
-    # ------------------------------------------------------------------
-    # SLIDES 3–N: One per Quick Win
-    # ------------------------------------------------------------------
-    for idx, opp in enumerate(quick_wins, 1):
-        slide = prs.slides.add_slide(blank_layout)
-        _set_slide_bg(slide)
-        _slide_title_bar(slide, f"Quick Win #{idx}: {opp.name}",
-                         "Low Effort  |  High Impact")
-
-        # Current State
-        _add_textbox(slide, Inches(0.9), Inches(1.6), Inches(5.5), Inches(0.35),
-                     "CURRENT STATE", font_size=13, colour=_GREEN_ACC, bold=True)
-        _add_textbox(slide, Inches(0.9), Inches(2.0), Inches(5.5), Inches(1.5),
-                     opp.description, font_size=16, colour=_LIGHT_GREY)
-
-        # Proposed Solution
-        _add_textbox(slide, Inches(0.9), Inches(3.7), Inches(5.5), Inches(0.35),
-                     "PROPOSED SOLUTION", font_size=13, colour=_GREEN_ACC, bold=True)
-
-        solution_text = (f"Automate and streamline this workflow using AI-powered tools, "
-                         f"eliminating manual effort and reducing error rates.")
-        _add_textbox(slide, Inches(0.9), Inches(4.1), Inches(5.5), Inches(1.2),
-                     solution_text, font_size=16, colour=_LIGHT_GREY)
-
-        # Impact panel on the right
-        hourly = roi_data["combined"]["hourly_rate"]
-        weekly_hrs = opp.hours_saved_weekly * opp.employees_affected * 0.7
-        weekly_saving = weekly_hrs * hourly
-        annual_saving = weekly_saving * 52
-
-        impact_rows = [
-            ("Impact Metric", "Value"),
-            ("Hours Saved / Week", f"{weekly_hrs:.0f} hrs"),
-            ("Employees Affected", str(opp.employees_affected)),
-            ("Est. Weekly Saving", f"${weekly_saving:,.0f}"),
-            ("Est. Annual Saving", f"${annual_saving:,.0f}"),
-            ("Implementation", "1-2 weeks"),
-        ]
-        _add_table(slide, impact_rows,
-                   left=Inches(7.0), top=Inches(1.6),
-                   width=Inches(5.5), col_widths=[Inches(3), Inches(2.5)],
-                   row_font_size=14)
-
-    # ------------------------------------------------------------------
-    # SLIDE: ROI Summary
-    # ------------------------------------------------------------------
-    slide = prs.slides.add_slide(blank_layout)
-    _set_slide_bg(slide)
-    _slide_title_bar(slide, "Return on Investment",
-                     "Cost savings + revenue potential from redirected capacity")
-
-    roi_rows = [
-        ("Metric", "Value"),
-        ("Estimated Implementation Cost", f"${combined['implementation_cost']:,.0f}"),
-        ("Hours Saved / Week", f"{combined['hours_saved_weekly']:.0f} hrs"),
-        ("Annual Cost Savings", f"${combined['annual_savings']:,.0f}"),
-        ("Annual Revenue Potential", f"${combined['annual_revenue_potential']:,.0f}"),
-        ("Total Annual Value", f"${combined['total_annual_value']:,.0f}"),
-        ("Payback Period", f"{combined['payback_months']:.1f} months"),
-        ("First Year ROI", f"{combined['roi_percentage']:.0f}%"),
-    ]
-    _add_table(slide, roi_rows,
-               left=Inches(0.8), top=Inches(1.6),
-               width=Inches(8), col_widths=[Inches(5), Inches(3)],
-               row_font_size=15)
-
-    # Visual callout
-    _add_textbox(slide, Inches(9.3), Inches(2.0), Inches(3.5), Inches(0.4),
-                 "FIRST YEAR ROI", font_size=13, colour=_GREEN_ACC, bold=True,
-                 alignment=PP_ALIGN.CENTER)
-    _add_textbox(slide, Inches(9.3), Inches(2.5), Inches(3.5), Inches(0.7),
-                 f"{combined['roi_percentage']:.0f}%",
-                 font_size=44, colour=_WHITE, bold=True,
-                 alignment=PP_ALIGN.CENTER)
-    _add_textbox(slide, Inches(9.3), Inches(3.4), Inches(3.5), Inches(0.4),
-                 f"Payback in {combined['payback_months']:.1f} months",
-                 font_size=14, colour=_LIGHT_GREY, alignment=PP_ALIGN.CENTER)
-
-    # ------------------------------------------------------------------
-    # SLIDE: Next Steps
-    # ------------------------------------------------------------------
-    slide = prs.slides.add_slide(blank_layout)
-    _set_slide_bg(slide)
-    _slide_title_bar(slide, "Recommended Next Steps")
-
-    steps = [
-        ("1", "Approve Phase 1 Quick Wins",
-         "Start with the highest-impact, lowest-effort items identified in this assessment."),
-        ("2", "Schedule Kickoff Meeting",
-         "Align the project team and define success metrics for each automation."),
-        ("3", "Begin Implementation",
-         "Target 2-4 week delivery for the first automation, with iterative rollout."),
-        ("4", "Measure & Iterate",
-         "Track time savings against baseline and expand to Phase 2 strategic initiatives."),
-    ]
+    buckets = group_by_category(opportunities)
+    quick_wins = buckets["quick_win"]
+    big_swings = buckets["big_swing"]
+
+    ctx = {
+        **roi_data["combined"],
+        "company_name": client.company_name,
+        "today": today,
+        "interviews_completed": project.interviews_completed,
+        "opportunity_count": len(opportunities),
+        "quick_win_count": len(quick_wins),
+        "big_swing_count": len(big_swings),
+    }
+
+    parts = [_REPORT_HEADER_TMPL.format_map(ctx)]
+
+    parts.extend(_phase_sections(quick_wins[:3], "1-2 weeks"))
+
+    if big_swings:
+        parts.append("### Phase 2: Strategic Initiatives (Months 2-6)\n\n")
+        parts.extend(_phase_sections(big_swings[:3], "4-8 weeks"))
+
+    parts.append(_REPORT_ROI_TMPL.format_map(ctx))
+    parts.append(_REPORT_FOOTER)
 
-    y_offset = Inches(1.8)
-    for num, title, desc in steps:
-        # Number circle (green square as proxy)
-        circle = slide.shapes.add_shape(MSO_SHAPE.OVAL,
-                                         Inches(0.9), y_offset,
-                                         Inches(0.45), Inches(0.45))
-        circle.fill.solid()
-        circle.fill.fore_color.rgb = _GREEN_ACC
-        circle.line.fill.background()
-        tf = circle.text_frame
-        tf.word_wrap = False
-        p = tf.paragraphs[0]
-        p.text = num
-        p.font.size = Pt(16)
-        p.font.color.rgb = _DARK_BG
-        p.font.bold = True
-        p.alignment = PP_ALIGN.CENTER
-        tf.paragraphs[0].space_before = Pt(0)
-        tf.paragraphs[0].space_after = Pt(0)
-
-        _add_textbox(slide, Inches(1.6), y_offset - Inches(0.05),
-                     Inches(10), Inches(0.4),
-                     title, font_size=20, colour=_WHITE, bold=True)
-        _add_textbox(slide, Inches(1.6), y_offset + Inches(0.35),
-                     Inches(10), Inches(0.4),
-                     desc, font_size=14, colour=_LIGHT_GREY)
-
-        y_offset += Inches(1.2)
-
-    # Footer on last slide
-    _add_textbox(slide, Inches(0.8), SLIDE_H - Inches(0.7), Inches(11), Inches(0.4),
-                 "GVRN-AI  |  AI Audit Framework  |  Confidential",
-                 font_size=11, colour=_MID_GREY, alignment=PP_ALIGN.CENTER)
-
-    # ------------------------------------------------------------------
-    # Save
-    # ------------------------------------------------------------------
-    prs.save(str(output_path))
-    return output_path
+    return "".join(parts)
+
+
+# ============================================================================
+# POWERPOINT REPORT GENERATOR
+# ============================================================================
+
+def generate_executive_pptx(project: AuditProject, roi_data: dict,
+                            output_path: Union[Path, BinaryIO],
+                            cover_date: Optional[date] = None) -> Union[Path, BinaryIO]:
+    """Generate a branded executive PowerPoint presentation.
+
+    `output_path` may be a filesystem path or a binary file-like object
+    (e.g. io.BytesIO) to keep the deck in memory. `cover_date` is the date
+    (or datetime) whose month is shown on the cover (defaults to now).
+    """
+
+    # python-pptx/lxml are heavy imports, so only load them when a deck is built
+    from pptx_report import generate_executive_pptx as _generate_pptx
+    return _generate_pptx(project, roi_data, output_path, cover_date=cover_date)
 
 
 # ============================================================================
 # CLI INTERFACE
 # ============================================================================
 
-def interactive_new_audit() -> AuditProject:
+def interactive_new_audit(created_date: Optional[str] = None) -> AuditProject:
     """Interactive wizard to create new audit project."""
 
     print("\n" + "="*60)
@@ -834,7 +671,7 @@ def interactive_new_audit() -> AuditProject:
     project = AuditProject(
         client=client,
         opportunities=[],
-        created_date=datetime.now().isoformat()
+        created_date=created_date or datetime.now().isoformat()
     )
 
     return project
@@ -862,150 +699,265 @@ def interactive_add_opportunity() -> Opportunity:
     )
 
 
-def save_project(project: AuditProject, output_dir: Path):
-    """Save project to JSON."""
+def project_to_json(project: AuditProject, compact: bool = False) -> bytes:
+    """Serialize a project to JSON bytes (indented, or compact for archives), via orjson when installed."""
+
+    if orjson is not None:
+        return orjson.dumps(project) if compact else orjson.dumps(project, option=orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(project.to_dict(), separators=(",", ":")).encode("utf-8")
+    return json.dumps(project.to_dict(), indent=2).encode("utf-8")
+
+
+_WRITE_BUFFER = 1 << 16
+
+
+def write_output(path: Path, text: str) -> None:
+    """Write a generated document in a single buffered UTF-8 write."""
+
+    with open(path, "w", encoding="utf-8", newline="\n", buffering=_WRITE_BUFFER) as f:
+        f.write(text)
+
+
+def save_project(project: AuditProject, output_dir: Path, compact: bool = False):
+    """Save project to JSON, or to compact gzipped JSON (.json.gz) for archiving."""
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
     safe_name = project.client.company_name.lower().replace(" ", "_")
     filepath = output_dir / f"{safe_name}_audit.json"
 
-    with open(filepath, "w") as f:
-        json.dump(asdict(project), f, indent=2)
+    if compact:
+        filepath = filepath.with_suffix(".json.gz")
+        with gzip.open(filepath, "wb", compresslevel=3) as f:
+            f.write(project_to_json(project, compact=True))
+    else:
+        with open(filepath, "wb", buffering=_WRITE_BUFFER) as f:
+            f.write(project_to_json(project))
 
     print(f"Project saved to: {filepath}")
     return filepath
 
 
+def _read_json(filepath: Path):
+    opener = gzip.open if filepath.suffix == ".gz" else open
+    with opener(filepath, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def load_project(filepath: Path) -> AuditProject:
-    """Load project from JSON."""
+    """Load project from JSON (plain or .json.gz)."""
 
-    with open(filepath) as f:
-        data = json.load(f)
+    return AuditProject.from_dict(_read_json(filepath))
 
-    client = Client(**data["client"])
-    opportunities = [Opportunity(**o) for o in data["opportunities"]]
 
-    return AuditProject(
-        client=client,
-        opportunities=opportunities,
-        created_date=data["created_date"],
-        interviews_completed=data.get("interviews_completed", 0),
-        status=data.get("status", "discovery")
-    )
+def _intake_text(value) -> str:
+    if not isinstance(value, str):
+        raise TypeError("expected a string")
+    return value.strip()
 
 
-def main():
-    parser = argparse.ArgumentParser(description="AI Audit Toolkit")
-    parser.add_argument("--new-audit", action="store_true", help="Start new audit project")
-    parser.add_argument("--questions", action="store_true", help="Generate interview questions")
-    parser.add_argument("--roi", action="store_true", help="Calculate ROI")
-    parser.add_argument("--report", action="store_true", help="Generate full report")
-    parser.add_argument("--project", "-p", type=str, help="Path to project JSON file")
-    parser.add_argument("--output", "-o", type=str, help="Output directory")
-    parser.add_argument("--example", "-e", action="store_true", help="Run with example data")
+def _intake_level(value) -> str:
+    return _intake_text(value).lower() or "medium"
 
-    args = parser.parse_args()
 
-    output_dir = Path(args.output) if args.output else Path.cwd() / "output"
+_REQUIRED = object()
 
-    # Example mode
-    if args.example:
-        client = Client(
-            company_name="Maplewood Residential Aged Care",
-            industry="aged_care",
-            employee_count=40,
-            contact_name="Karen Mitchell",
-            contact_email="karen.mitchell@maplewoodcare.com.au",
-            avg_salary=62000  # AUD average across RNs, ENs, PCAs, and admin
-        )
+# Intake field -> (coercion, default), mirroring the wizard's prompts and fallbacks
+_INTAKE_PROJECT = {
+    "client": (None, _REQUIRED),
+    "opportunities": (None, []),
+    "created_date": (_intake_text, None),
+    "interviews_completed": (int, 0),
+    "status": (_intake_text, "discovery"),
+}
+_INTAKE_CLIENT = {
+    "company_name": (_intake_text, _REQUIRED),
+    "industry": (_intake_text, _REQUIRED),
+    "employee_count": (int, 50),
+    "contact_name": (_intake_text, _REQUIRED),
+    "contact_email": (_intake_text, _REQUIRED),
+    "avg_salary": (float, 65000.0),
+}
+_INTAKE_OPPORTUNITY = {
+    "name": (_intake_text, _REQUIRED),
+    "description": (_intake_text, _REQUIRED),
+    "hours_saved_weekly": (float, 5.0),
+    "employees_affected": (int, 1),
+    "effort": (_intake_level, "medium"),
+    "impact": (_intake_level, "medium"),
+    "category": (_intake_text, ""),
+}
 
-        opportunities = [
-            Opportunity(
-                "Digital Incident Reporting & SIRS Compliance",
-                "Paper-based incident forms take 30-45 min each; SIRS notifications to the Aged Care Quality and Safety Commission are manually tracked in a spreadsheet",
-                6, 3, "low", "high"
-            ),
-            Opportunity(
-                "AI-Assisted Quality Standards Documentation",
-                "Admin staff spend 12+ hrs/week manually compiling evidence portfolios for the 8 Aged Care Quality Standards and continuous improvement registers",
-                10, 3, "low", "high"
-            ),
-            Opportunity(
-                "Automated AN-ACC Care Minutes Tracking",
-                "Manual tracking of direct and indirect care minutes across shifts for AN-ACC funding submissions; staff record on paper timesheets then admin re-enters into government portal",
-                5, 5, "low", "high"
-            ),
-            Opportunity(
-                "Electronic Medication Management",
-                "Paper medication charts with manual round tracking; double-handling between pharmacy orders, GP scripts, and MAR charts increases medication error risk",
-                4, 8, "high", "high"
-            ),
-            Opportunity(
-                "Clinical Care Plan Automation",
-                "Quarterly care plan reviews done manually across 45 residents with paper-based assessments; RNs spend evenings updating plans instead of providing direct care",
-                3, 8, "high", "high"
-            ),
-            Opportunity(
-                "Resident & Family Communication Portal",
-                "Manual phone calls and printed letters to families for care updates, activity schedules, and incident notifications; families frequently call reception for updates",
-                3, 4, "low", "low"
-            ),
-            Opportunity(
-                "Staff Rostering Optimisation",
-                "Manual roster creation in spreadsheets; difficulty balancing AN-ACC care minute targets, staff availability, and award conditions across 24/7 shifts",
-                5, 2, "low", "low"
-            ),
-        ]
-
-        project = AuditProject(
-            client=client,
-            opportunities=opportunities,
-            created_date=datetime.now().isoformat(),
-            interviews_completed=8,
-            status="analysis"
-        )
 
-        # Generate all outputs
-        output_dir.mkdir(parents=True, exist_ok=True)
+def _intake_section(raw, spec: dict, where: str) -> dict:
+    """Validate one intake object against `spec`, coercing values and filling defaults."""
+
+    if not isinstance(raw, dict):
+        raise ValueError(f"{where} must be a JSON object")
+    unknown = sorted(set(raw) - set(spec))
+    if unknown:
+        raise ValueError(f"{where} has unknown field(s): {', '.join(unknown)}")
+
+    section = {}
+    for key, (coerce, default) in spec.items():
+        value = raw.get(key)
+        if value is None:
+            if default is _REQUIRED:
+                raise ValueError(f"{where} is missing {key}")
+            section[key] = default
+        elif coerce is None:
+            section[key] = value
+        else:
+            try:
+                section[key] = coerce(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{where} has invalid {key}: {value!r}") from None
+    return section
+
+
+def load_batch_input(filepath: Path, created_date: Optional[str] = None) -> AuditProject:
+    """Create a new project from a JSON intake form (non-interactive new-audit).
+
+    The form uses the saved-project layout and is normalized like the wizard's
+    answers: strings are stripped, numbers coerced with int()/float(), and
+    employee count, hours, employees affected and effort/impact (lowercased)
+    get the wizard defaults. A form without `created_date` is stamped with the
+    given `created_date`, or the current time; a missing opportunity
+    `category` is derived as in the wizard.
+    Raises ValueError naming the offending field for a missing, unknown or
+    malformed entry.
+    """
+
+    data = _intake_section(_read_json(filepath), _INTAKE_PROJECT, f"{filepath}")
+    data["client"] = _intake_section(data["client"], _INTAKE_CLIENT, f"{filepath}: client")
+    if not isinstance(data["opportunities"], list):
+        raise ValueError(f"{filepath}: opportunities must be a JSON array")
+    data["opportunities"] = [_intake_section(opp, _INTAKE_OPPORTUNITY, f"{filepath}: opportunity {i}")
+                             for i, opp in enumerate(data["opportunities"], 1)]
+    data["created_date"] = data["created_date"] or created_date or datetime.now().isoformat()
+    return AuditProject.from_dict(data)
+
+
+def _output_dir(args) -> Path:
+    return Path(args.output) if args.output else Path.cwd() / "output"
+
+
+def _cmd_example(args, now: datetime):
+    """Generate every deliverable for the built-in example client."""
+
+    output_dir = _output_dir(args)
+    today = now.strftime("%Y-%m-%d")
+
+    client = Client(
+        company_name="Maplewood Residential Aged Care",
+        industry="aged_care",
+        employee_count=40,
+        contact_name="Karen Mitchell",
+        contact_email="karen.mitchell@maplewoodcare.com.au",
+        avg_salary=62000  # AUD average across RNs, ENs, PCAs, and admin
+    )
+
+    opportunities = [
+        Opportunity(
+            "Digital Incident Reporting & SIRS Compliance",
+            "Paper-based incident forms take 30-45 min each; SIRS notifications to the Aged Care Quality and Safety Commission are manually tracked in a spreadsheet",
+            6, 3, "low", "high"
+        ),
+        Opportunity(
+            "AI-Assisted Quality Standards Documentation",
+            "Admin staff spend 12+ hrs/week manually compiling evidence portfolios for the 8 Aged Care Quality Standards and continuous improvement registers",
+            10, 3, "low", "high"
+        ),
+        Opportunity(
+            "Automated AN-ACC Care Minutes Tracking",
+            "Manual tracking of direct and indirect care minutes across shifts for AN-ACC funding submissions; staff record on paper timesheets then admin re-enters into government portal",
+            5, 5, "low", "high"
+        ),
+        Opportunity(
+            "Electronic Medication Management",
+            "Paper medication charts with manual round tracking; double-handling between pharmacy orders, GP scripts, and MAR charts increases medication error risk",
+            4, 8, "high", "high"
+        ),
+        Opportunity(
+            "Clinical Care Plan Automation",
+            "Quarterly care plan reviews done manually across 45 residents with paper-based assessments; RNs spend evenings updating plans instead of providing direct care",
+            3, 8, "high", "high"
+        ),
+        Opportunity(
+            "Resident & Family Communication Portal",
+            "Manual phone calls and printed letters to families for care updates, activity schedules, and incident notifications; families frequently call reception for updates",
+            3, 4, "low", "low"
+        ),
+        Opportunity(
+            "Staff Rostering Optimisation",
+            "Manual roster creation in spreadsheets; difficulty balancing AN-ACC care minute targets, staff availability, and award conditions across 24/7 shifts",
+            5, 2, "low", "low"
+        ),
+    ]
+
+    project = AuditProject(
+        client=client,
+        opportunities=opportunities,
+        created_date=now.isoformat(),
+        interviews_completed=8,
+        status="analysis"
+    )
+
+    # Generate all outputs
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # ROI calculation
+    roi_data = calculate_audit_roi(opportunities, client.avg_salary, 25000)
+
+    # The deck is the slowest deliverable, so build it on a worker thread
+    # while the Markdown documents are generated and written.
+    pptx_path = output_dir / "executive_presentation.pptx"
+    from concurrent.futures import ThreadPoolExecutor  # only the deck-building commands need it
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        deck = pool.submit(generate_executive_pptx, project, roi_data, pptx_path, now)
 
         # Interview questions
-        questions = generate_interview_doc(client)
+        questions = generate_interview_doc(client, today=today)
         q_path = output_dir / "interview_questions.md"
-        q_path.write_text(questions)
+        write_output(q_path, questions)
         print(f"Interview questions: {q_path}")
 
         # Opportunity matrix
         matrix = generate_opportunity_matrix(opportunities)
         m_path = output_dir / "opportunity_matrix.md"
-        m_path.write_text(matrix)
+        write_output(m_path, matrix)
         print(f"Opportunity matrix: {m_path}")
 
-        # ROI calculation
-        roi_data = calculate_audit_roi(opportunities, client.avg_salary, 25000)
-
         # Executive report
-        report = generate_executive_report(project, roi_data)
+        report = generate_executive_report(project, roi_data, today=today)
         r_path = output_dir / "executive_report.md"
-        r_path.write_text(report)
+        write_output(r_path, report)
         print(f"Executive report: {r_path}")
 
         # Executive PowerPoint
-        pptx_path = output_dir / "executive_presentation.pptx"
-        generate_executive_pptx(project, roi_data, pptx_path)
+        deck.result()
         print(f"Executive PPTX:   {pptx_path}")
 
-        # Save project
-        save_project(project, output_dir)
+    # Save project
+    save_project(project, output_dir, compact=args.gzip)
+
+    print("\n" + "="*60)
+    print("Example audit generated! Check the output/ folder.")
+    print("="*60)
 
-        print("\n" + "="*60)
-        print("Example audit generated! Check the output/ folder.")
-        print("="*60)
-        return
 
-    # New audit
-    if args.new_audit:
-        project = interactive_new_audit()
+def _cmd_new_audit(args, now: datetime):
+    """Create a project via the interactive wizard, or from --batch-input."""
+
+    if args.batch_input:
+        try:
+            project = load_batch_input(Path(args.batch_input), created_date=now.isoformat())
+        except ValueError as exc:
+            sys.exit(f"Invalid intake form: {exc}")
+    else:
+        project = interactive_new_audit(created_date=now.isoformat())
 
         # Ask if they want to add opportunities
         while True:
@@ -1016,40 +968,136 @@ def main():
             else:
                 break
 
-        save_project(project, output_dir)
-        return
+    save_project(project, _output_dir(args), compact=args.gzip)
 
-    # Load existing project for other commands
-    if args.project:
-        project = load_project(Path(args.project))
-    else:
-        print("Use --example for demo, --new-audit to start, or --project <file> to load existing.")
-        return
 
-    # Generate questions
-    if args.questions:
-        questions = generate_interview_doc(project.client)
-        q_path = output_dir / "interview_questions.md"
-        q_path.write_text(questions)
-        print(f"Saved to: {q_path}")
-
-    # Calculate ROI
-    if args.roi:
-        roi_data = calculate_audit_roi(project.opportunities, project.client.avg_salary, 15000)
-        print(json.dumps(roi_data, indent=2))
-
-    # Generate report
-    if args.report:
-        roi_data = calculate_audit_roi(project.opportunities, project.client.avg_salary, 15000)
-        report = generate_executive_report(project, roi_data)
+def _cmd_questions(args, now: datetime):
+    """Write the interview questions for a saved project."""
+
+    project = load_project(Path(args.project))
+    output_dir = _output_dir(args)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    questions = generate_interview_doc(project.client, today=now.strftime("%Y-%m-%d"))
+    q_path = output_dir / "interview_questions.md"
+    write_output(q_path, questions)
+    print(f"Saved to: {q_path}")
+
+
+def _cmd_roi(args, now: datetime):
+    """Print the ROI breakdown for a saved project."""
+
+    project = load_project(Path(args.project))
+    roi_data = calculate_audit_roi(project.opportunities, project.client.avg_salary, 15000)
+    print(json.dumps(roi_data, indent=2))
+
+
+def _cmd_report(args, now: datetime):
+    """Write the executive report (Markdown + PPTX) for a saved project."""
+
+    project = load_project(Path(args.project))
+    output_dir = _output_dir(args)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    today = now.strftime("%Y-%m-%d")
+    roi_data = calculate_audit_roi(project.opportunities, project.client.avg_salary, 15000)
+    pptx_path = output_dir / "executive_presentation.pptx"
+    from concurrent.futures import ThreadPoolExecutor  # only the deck-building commands need it
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        deck = pool.submit(generate_executive_pptx, project, roi_data, pptx_path, now)
+
+        report = generate_executive_report(project, roi_data, today=today)
         r_path = output_dir / "executive_report.md"
-        r_path.write_text(report)
+        write_output(r_path, report)
         print(f"Saved to: {r_path}")
 
-        pptx_path = output_dir / "executive_presentation.pptx"
-        generate_executive_pptx(project, roi_data, pptx_path)
+        deck.result()
         print(f"Saved to: {pptx_path}")
 
 
+COMMANDS = {
+    "example": _cmd_example,
+    "new-audit": _cmd_new_audit,
+    "questions": _cmd_questions,
+    "roi": _cmd_roi,
+    "report": _cmd_report,
+}
+
+
+def _legacy_main(argv: List[str], now: datetime):
+    """Run the deprecated flag-style CLI (`--example`, `-p FILE --questions --roi --report`, ...).
+
+    Kept so existing scripts keep working; each flag maps onto its subcommand
+    handler, and one run may still combine --questions, --roi and --report.
+    """
+
+    parser = argparse.ArgumentParser(description="AI Audit Toolkit (deprecated flag syntax)")
+    parser.add_argument("--new-audit", action="store_true", help="Start new audit project")
+    parser.add_argument("--batch-input", type=str, metavar="FILE", help="New project from a JSON intake form")
+    parser.add_argument("--questions", action="store_true", help="Generate interview questions")
+    parser.add_argument("--roi", action="store_true", help="Calculate ROI")
+    parser.add_argument("--report", action="store_true", help="Generate full report")
+    parser.add_argument("--project", "-p", type=str, help="Path to project JSON file")
+    parser.add_argument("--output", "-o", type=str, help="Output directory")
+    parser.add_argument("--example", "-e", action="store_true", help="Run with example data")
+    parser.set_defaults(gzip=False)
+    args = parser.parse_args(argv)
+
+    print("warning: flag-style options are deprecated; use the subcommands instead "
+          "(e.g. `audit_toolkit.py example`, `audit_toolkit.py report -p FILE`)", file=sys.stderr)
+
+    if args.example:
+        return _cmd_example(args, now)
+    if args.new_audit or args.batch_input:
+        return _cmd_new_audit(args, now)
+    if not args.project:
+        print("Use --example for demo, --new-audit to start, or --project <file> to load existing.")
+        return
+    for flag, handler in (("questions", _cmd_questions), ("roi", _cmd_roi), ("report", _cmd_report)):
+        if getattr(args, flag):
+            handler(args, now)
+
+
+def main():
+    argv = sys.argv[1:]
+
+    # One clock read per run: every date a command stamps (document dates, the deck
+    # cover, a new project's created_date) comes from it. All handlers take it so
+    # they share one signature, even those that stamp nothing (roi).
+    now = datetime.now()
+
+    # Subcommands never start with an option, so a leading flag means the old syntax
+    if argv and argv[0].startswith("-") and argv[0] not in ("-h", "--help"):
+        return _legacy_main(argv, now)
+
+    parser = argparse.ArgumentParser(description="AI Audit Toolkit")
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--output", "-o", type=str, help="Output directory")
+    project = argparse.ArgumentParser(add_help=False)
+    project.add_argument("--project", "-p", type=str, required=True, help="Path to project JSON file")
+
+    save = argparse.ArgumentParser(add_help=False)
+    save.add_argument("--gzip", "--compact", action="store_true",
+                      help="Save the project as compact gzipped JSON (.json.gz)")
+
+    sub.add_parser("example", parents=[output, save], help="Run with example data")
+    new_audit = sub.add_parser("new-audit", parents=[output, save], help="Start new audit project")
+    new_audit.add_argument("--batch-input", type=str, metavar="FILE",
+                           help="Create the project from a JSON intake form (no prompts)")
+    sub.add_parser("questions", parents=[project, output], help="Generate interview questions")
+    sub.add_parser("roi", parents=[project], help="Calculate ROI")
+    sub.add_parser("report", parents=[project, output], help="Generate full report")
+
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        parser.print_help()
+        return
+
+    COMMANDS[args.command](args, now)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,442 @@
+"""
+PowerPoint report generator for the AI Audit Toolkit.
+
+Lives outside audit_toolkit.py so python-pptx (and lxml) are only imported
+when a deck is actually built.
+"""
+
+import io
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from xml.sax.saxutils import escape
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Optional, Union
+
+from pptx import Presentation
+from pptx.util import Inches, Pt, Emu
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.shapes.autoshape import Shape
+
+if TYPE_CHECKING:
+    from audit_toolkit import AuditProject
+
+# Brand colours
+_DARK_BG     = RGBColor(0x1A, 0x1A, 0x2E)   # deep navy
+_GREEN_ACC   = RGBColor(0x00, 0xC9, 0x7B)   # GVRN green
+_WHITE       = RGBColor(0xFF, 0xFF, 0xFF)
+_LIGHT_GREY  = RGBColor(0xCC, 0xCC, 0xCC)
+_MID_GREY    = RGBColor(0x88, 0x88, 0x88)
+_TABLE_ROW1  = RGBColor(0x22, 0x22, 0x3A)   # table odd-row
+_TABLE_ROW2  = RGBColor(0x2A, 0x2A, 0x44)   # table even-row
+
+SLIDE_W = Inches(13.333)
+SLIDE_H = Inches(7.5)
+
+# Bound formatters for the figures repeated across slides
+_fmt_usd = "${:,.0f}".format
+_fmt_hrs = "{:.0f} hrs".format
+_fmt_pct = "{:.0f}%".format
+
+# PP_ALIGN -> <a:pPr algn>; mapped here because enum .xml_value needs python-pptx >= 1.0
+_ALIGN_XML = {
+    PP_ALIGN.LEFT: "l", PP_ALIGN.CENTER: "ctr", PP_ALIGN.RIGHT: "r",
+    PP_ALIGN.JUSTIFY: "just", PP_ALIGN.JUSTIFY_LOW: "justLow",
+    PP_ALIGN.DISTRIBUTE: "dist", PP_ALIGN.THAI_DISTRIBUTE: "thaiDist",
+}
+
+# Characters XML 1.0 forbids in text (plus \r, which parsers fold into \n);
+# written as python-pptx does, in the _xHHHH_ escape form
+_ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b-\x1f]")
+
+# Borderless cell edges; they lead <a:tcPr>, ahead of the cell fill, per the DrawingML schema
+_NO_BORDERS_XML = "".join(f'<a:{t} w="0" cap="flat"><a:noFill/></a:{t}>'
+                          for t in ("lnL", "lnR", "lnT", "lnB"))
+
+
+@lru_cache(maxsize=None)
+def _template_bytes() -> bytes:
+    """The empty widescreen deck every report starts from, built once per process."""
+    prs = Presentation()
+    prs.slide_width = SLIDE_W
+    prs.slide_height = SLIDE_H
+    buf = io.BytesIO()
+    prs.save(buf)
+    return buf.getvalue()
+
+
+def _set_slide_bg(slide, colour=_DARK_BG):
+    bg = slide.background
+    fill = bg.fill
+    fill.solid()
+    fill.fore_color.rgb = colour
+
+
+def _xml_text(text):
+    """Escape text for an <a:t> element, including characters XML cannot carry."""
+    return escape(_ILLEGAL_XML_CHARS.sub(lambda m: f"_x{ord(m.group()):04X}_", text))
+
+
+def _runs_xml(text):
+    # Line breaks become <a:br/> between runs, as the python-pptx text setter does
+    return "<a:br/>".join(f"<a:r><a:t>{_xml_text(seg)}</a:t></a:r>" if seg else ""
+                          for seg in text.replace("\v", "\n").split("\n"))
+
+
+def _textbox_xml(shape_id, left, top, width, height, text,
+                 font_size=18, colour=_WHITE, bold=False,
+                 alignment=PP_ALIGN.LEFT):
+    """<p:sp> markup for a single-paragraph text box, as add_textbox would build it."""
+    algn = _ALIGN_XML.get(alignment)
+    if algn is None:
+        raise ValueError(f"unsupported text box alignment: {alignment!r}")
+    return (
+        f'<p:sp>'
+        f'<p:nvSpPr><p:cNvPr id="{shape_id}" name="TextBox {shape_id - 1}"/>'
+        f'<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+        f'<p:spPr><a:xfrm><a:off x="{int(left)}" y="{int(top)}"/><a:ext cx="{int(width)}" cy="{int(height)}"/></a:xfrm>'
+        f'<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+        f'<p:txBody><a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+        f'<a:p><a:pPr algn="{algn}"><a:defRPr sz="{int(font_size * 100)}" b="{int(bool(bold))}">'
+        f'<a:solidFill><a:srgbClr val="{colour}"/></a:solidFill></a:defRPr></a:pPr>{_runs_xml(text)}</a:p>'
+        f'</p:txBody></p:sp>'
+    )
+
+
+def _badge_xml(shape_id, left, top, size, text):
+    """<p:sp> markup for a borderless green oval with centred dark number text."""
+    return (
+        f'<p:sp>'
+        f'<p:nvSpPr><p:cNvPr id="{shape_id}" name="Oval {shape_id - 1}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+        f'<p:spPr><a:xfrm><a:off x="{int(left)}" y="{int(top)}"/><a:ext cx="{int(size)}" cy="{int(size)}"/></a:xfrm>'
+        f'<a:prstGeom prst="ellipse"><a:avLst/></a:prstGeom>'
+        f'<a:solidFill><a:srgbClr val="{_GREEN_ACC}"/></a:solidFill><a:ln><a:noFill/></a:ln></p:spPr>'
+        f'<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+        f'<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+        f'<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+        f'<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+        f'<p:txBody><a:bodyPr rtlCol="0" anchor="ctr" wrap="none"/><a:lstStyle/>'
+        f'<a:p><a:pPr algn="ctr"><a:spcBef><a:spcPts val="0"/></a:spcBef><a:spcAft><a:spcPts val="0"/></a:spcAft>'
+        f'<a:defRPr sz="1600" b="1"><a:solidFill><a:srgbClr val="{_DARK_BG}"/></a:solidFill></a:defRPr></a:pPr>'
+        f'{_runs_xml(text)}</a:p></p:txBody></p:sp>'
+    )
+
+
+def _append_shapes(slide, sp_xml):
+    """Parse pre-built <p:sp> fragments in one pass and add them to the slide in order.
+
+    Returns the inserted <p:sp> elements.
+    """
+    spTree = slide.shapes._spTree
+    sps = list(parse_xml(f'<p:spTree {nsdecls("a", "p")}>{"".join(sp_xml)}</p:spTree>'))
+    for sp in sps:
+        spTree.insert_element_before(sp, "p:extLst")
+    return sps
+
+
+def _add_textbox(slide, left, top, width, height, text,
+                 font_size=18, colour=_WHITE, bold=False,
+                 alignment=PP_ALIGN.LEFT):
+    """Append a single-paragraph text box, built as one <p:sp> fragment.
+
+    Produces the same XML as add_textbox + word_wrap + paragraph font settings,
+    without a python-pptx descriptor round-trip per property. Returns the
+    text box's text frame.
+    """
+    sp, = _append_shapes(slide, [_textbox_xml(slide.shapes._next_shape_id, left, top, width, height, text,
+                                              font_size, colour, bold, alignment)])
+    return Shape(sp, slide.shapes).text_frame
+
+
+@lru_cache(maxsize=None)
+def _row_height(font_size) -> int:
+    """Table row height in EMU for a given font size (text plus padding)."""
+    return Pt(font_size + 18).emu
+
+
+def _add_table(slide, rows_data, left, top, width, col_widths,
+               header_colour=_GREEN_ACC, row_font_size=14):
+    """Add a styled table to a slide. rows_data = list of tuples."""
+    rows = len(rows_data)
+    cols = len(rows_data[0]) if rows_data else 2
+    table_shape = slide.shapes.add_table(rows, cols, left, top, width,
+                                          Emu(rows * _row_height(row_font_size)))
+    table = table_shape.table
+
+    # Build the styled rows as one XML fragment and swap it in for the empty
+    # table python-pptx generated, instead of styling cell by cell through its API.
+    # add_table still supplies the frame, the default table style and row heights.
+    tbl = table._tbl
+    grid = [gc.w for gc in tbl.tblGrid.gridCol_lst]
+    grid[:len(col_widths)] = col_widths
+    heights = [tr.h for tr in tbl.tr_lst]
+    sz = int(row_font_size * 100)
+
+    xml = [f"<a:tbl {nsdecls('a')}><a:tblGrid>"]
+    xml += [f'<a:gridCol w="{w}"/>' for w in grid]
+    xml.append("</a:tblGrid>")
+    for r_idx, row_vals in enumerate(rows_data):
+        if r_idx == 0:
+            fill, text_colour, bold = _DARK_BG, header_colour, "1"
+        else:
+            fill, text_colour, bold = (_TABLE_ROW1 if r_idx % 2 == 1 else _TABLE_ROW2), _WHITE, "0"
+        tcPr = f'<a:tcPr>{_NO_BORDERS_XML}<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill></a:tcPr>'
+        xml.append(f'<a:tr h="{heights[r_idx]}">')
+        for c_idx in range(cols):
+            if c_idx >= len(row_vals):
+                xml.append(f"<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p/></a:txBody><a:tcPr>{_NO_BORDERS_XML}</a:tcPr></a:tc>")
+                continue
+            pPr = (f'<a:pPr algn="{"l" if c_idx == 0 else "r"}"><a:defRPr sz="{sz}" b="{bold}">'
+                   f'<a:solidFill><a:srgbClr val="{text_colour}"/></a:solidFill></a:defRPr></a:pPr>')
+            xml.append("<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>")
+            for line in str(row_vals[c_idx]).split("\n"):
+                xml.append(f"<a:p>{pPr}{_runs_xml(line)}</a:p>")
+            xml.append(f"</a:txBody>{tcPr}</a:tc>")
+        xml.append("</a:tr>")
+    xml.append("</a:tbl>")
+
+    new_tbl = parse_xml("".join(xml))
+    new_tbl.insert(0, tbl.tblPr)
+    tbl.getparent().replace(tbl, new_tbl)
+    table_shape.width = sum(grid)
+
+    return table_shape.table
+
+
+def _slide_title_bar(slide, title_text, subtitle_text=None):
+    """Add a thin green accent line + title at the top of a content slide."""
+    # Green accent line
+    line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE,
+                                   Inches(0.6), Inches(0.5),
+                                   Inches(0.08), Inches(0.55))
+    line.fill.solid()
+    line.fill.fore_color.rgb = _GREEN_ACC
+    line.line.fill.background()
+
+    _add_textbox(slide, Inches(0.9), Inches(0.4), Inches(10), Inches(0.55),
+                 title_text, font_size=28, colour=_WHITE, bold=True)
+    if subtitle_text:
+        _add_textbox(slide, Inches(0.9), Inches(0.95), Inches(10), Inches(0.4),
+                     subtitle_text, font_size=14, colour=_LIGHT_GREY)
+
+
+def generate_executive_pptx(project: "AuditProject", roi_data: dict,
+                            output_path: Union[Path, BinaryIO],
+                            cover_date: Optional[date] = None) -> Union[Path, BinaryIO]:
+    """Generate a branded executive PowerPoint presentation.
+
+    `output_path` may be a filesystem path or a binary file-like object
+    (e.g. io.BytesIO) to keep the deck in memory. `cover_date` is the date
+    (or datetime) whose month is shown on the cover (defaults to now).
+    """
+
+    client = project.client
+    opportunities = project.opportunities
+    quick_wins, big_swings = [], []
+    for o in opportunities:
+        if o.category == "quick_win":
+            quick_wins.append(o)
+        elif o.category == "big_swing":
+            big_swings.append(o)
+
+    prs = Presentation(io.BytesIO(_template_bytes()))
+    blank_layout = prs.slide_layouts[6]  # blank
+
+    # ------------------------------------------------------------------
+    # SLIDE 1: Cover
+    # ------------------------------------------------------------------
+    slide = prs.slides.add_slide(blank_layout)
+    _set_slide_bg(slide)
+
+    # Green accent bar at top
+    bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE,
+                                  Inches(0), Inches(0),
+                                  SLIDE_W, Inches(0.08))
+    bar.fill.solid()
+    bar.fill.fore_color.rgb = _GREEN_ACC
+    bar.line.fill.background()
+
+    _add_textbox(slide, Inches(0.8), Inches(1.8), Inches(11), Inches(0.9),
+                 "GVRN-AI", font_size=20, colour=_GREEN_ACC, bold=True)
+    _add_textbox(slide, Inches(0.8), Inches(2.5), Inches(11), Inches(1.0),
+                 "AI Opportunity Assessment", font_size=40, colour=_WHITE, bold=True)
+    _add_textbox(slide, Inches(0.8), Inches(3.6), Inches(11), Inches(0.7),
+                 client.company_name, font_size=28, colour=_LIGHT_GREY)
+
+    date_str = (cover_date or datetime.now()).strftime("%B %Y")
+    _add_textbox(slide, Inches(0.8), Inches(5.0), Inches(11), Inches(0.5),
+                 f"Prepared for {client.contact_name}  |  {date_str}",
+                 font_size=14, colour=_MID_GREY)
+
+    # Bottom green bar
+    bar2 = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE,
+                                   Inches(0), SLIDE_H - Inches(0.08),
+                                   SLIDE_W, Inches(0.08))
+    bar2.fill.solid()
+    bar2.fill.fore_color.rgb = _GREEN_ACC
+    bar2.line.fill.background()
+
+    # ------------------------------------------------------------------
+    # SLIDE 2: Executive Summary
+    # ------------------------------------------------------------------
+    slide = prs.slides.add_slide(blank_layout)
+    _set_slide_bg(slide)
+    _slide_title_bar(slide, "Executive Summary",
+                     f"Based on {project.interviews_completed} discovery interviews")
+
+    combined = roi_data["combined"]
+    summary_rows = [
+        ("Metric", "Value"),
+        ("Total Opportunities Identified", str(len(opportunities))),
+        ("Quick Wins (Start Immediately)", str(len(quick_wins))),
+        ("Strategic Initiatives", str(len(big_swings))),
+        ("Estimated Hours Saved / Week", _fmt_hrs(combined["hours_saved_weekly"])),
+        ("Annual Cost Savings", _fmt_usd(combined["annual_savings"])),
+        ("Annual Revenue Potential", _fmt_usd(combined["annual_revenue_potential"])),
+        ("Total Annual Value", _fmt_usd(combined["total_annual_value"])),
+    ]
+
+    _add_table(slide, summary_rows,
+               left=Inches(0.8), top=Inches(1.6),
+               width=Inches(8), col_widths=[Inches(5), Inches(3)],
+               row_font_size=15)
+
+    # Callout box on the right
+    _add_textbox(slide, Inches(9.3), Inches(2.0), Inches(3.5), Inches(0.4),
+                 "TOTAL ANNUAL VALUE", font_size=13, colour=_GREEN_ACC, bold=True,
+                 alignment=PP_ALIGN.CENTER)
+    _add_textbox(slide, Inches(9.3), Inches(2.5), Inches(3.5), Inches(0.7),
+                 _fmt_usd(combined["total_annual_value"]),
+                 font_size=36, colour=_WHITE, bold=True,
+                 alignment=PP_ALIGN.CENTER)
+    _add_textbox(slide, Inches(9.3), Inches(3.3), Inches(3.5), Inches(0.4),
+                 f"ROI {combined['roi_percentage']:.0f}%  |  Payback {combined['payback_months']:.1f} mo",
+                 font_size=13, colour=_LIGHT_GREY, alignment=PP_ALIGN.CENTER)
+
+    # ------------------------------------------------------------------
+    # SLIDES 3–N: One per Quick Win
+    # ------------------------------------------------------------------
+    hourly = combined["hourly_rate"]
+    for idx, opp in enumerate(quick_wins, 1):
+        slide = prs.slides.add_slide(blank_layout)
+        _set_slide_bg(slide)
+        _slide_title_bar(slide, f"Quick Win #{idx}: {opp.name}",
+                         "Low Effort  |  High Impact")
+
+        # Current State
+        _add_textbox(slide, Inches(0.9), Inches(1.6), Inches(5.5), Inches(0.35),
+                     "CURRENT STATE", font_size=13, colour=_GREEN_ACC, bold=True)
+        _add_textbox(slide, Inches(0.9), Inches(2.0), Inches(5.5), Inches(1.5),
+                     opp.description, font_size=16, colour=_LIGHT_GREY)
+
+        # Proposed Solution
+        _add_textbox(slide, Inches(0.9), Inches(3.7), Inches(5.5), Inches(0.35),
+                     "PROPOSED SOLUTION", font_size=13, colour=_GREEN_ACC, bold=True)
+
+        solution_text = (f"Automate and streamline this workflow using AI-powered tools, "
+                         f"eliminating manual effort and reducing error rates.")
+        _add_textbox(slide, Inches(0.9), Inches(4.1), Inches(5.5), Inches(1.2),
+                     solution_text, font_size=16, colour=_LIGHT_GREY)
+
+        # Impact panel on the right
+        weekly_hrs = opp.total_weekly_hours * 0.7
+        weekly_saving = weekly_hrs * hourly
+        annual_saving = weekly_saving * 52
+
+        impact_rows = [
+            ("Impact Metric", "Value"),
+            ("Hours Saved / Week", _fmt_hrs(weekly_hrs)),
+            ("Employees Affected", str(opp.employees_affected)),
+            ("Est. Weekly Saving", _fmt_usd(weekly_saving)),
+            ("Est. Annual Saving", _fmt_usd(annual_saving)),
+            ("Implementation", "1-2 weeks"),
+        ]
+        _add_table(slide, impact_rows,
+                   left=Inches(7.0), top=Inches(1.6),
+                   width=Inches(5.5), col_widths=[Inches(3), Inches(2.5)],
+                   row_font_size=14)
+
+    # ------------------------------------------------------------------
+    # SLIDE: ROI Summary
+    # ------------------------------------------------------------------
+    slide = prs.slides.add_slide(blank_layout)
+    _set_slide_bg(slide)
+    _slide_title_bar(slide, "Return on Investment",
+                     "Cost savings + revenue potential from redirected capacity")
+
+    roi_rows = [
+        ("Metric", "Value"),
+        ("Estimated Implementation Cost", _fmt_usd(combined["implementation_cost"])),
+        ("Hours Saved / Week", _fmt_hrs(combined["hours_saved_weekly"])),
+        ("Annual Cost Savings", _fmt_usd(combined["annual_savings"])),
+        ("Annual Revenue Potential", _fmt_usd(combined["annual_revenue_potential"])),
+        ("Total Annual Value", _fmt_usd(combined["total_annual_value"])),
+        ("Payback Period", f"{combined['payback_months']:.1f} months"),
+        ("First Year ROI", _fmt_pct(combined["roi_percentage"])),
+    ]
+    _add_table(slide, roi_rows,
+               left=Inches(0.8), top=Inches(1.6),
+               width=Inches(8), col_widths=[Inches(5), Inches(3)],
+               row_font_size=15)
+
+    # Visual callout
+    _add_textbox(slide, Inches(9.3), Inches(2.0), Inches(3.5), Inches(0.4),
+                 "FIRST YEAR ROI", font_size=13, colour=_GREEN_ACC, bold=True,
+                 alignment=PP_ALIGN.CENTER)
+    _add_textbox(slide, Inches(9.3), Inches(2.5), Inches(3.5), Inches(0.7),
+                 _fmt_pct(combined["roi_percentage"]),
+                 font_size=44, colour=_WHITE, bold=True,
+                 alignment=PP_ALIGN.CENTER)
+    _add_textbox(slide, Inches(9.3), Inches(3.4), Inches(3.5), Inches(0.4),
+                 f"Payback in {combined['payback_months']:.1f} months",
+                 font_size=14, colour=_LIGHT_GREY, alignment=PP_ALIGN.CENTER)
+
+    # ------------------------------------------------------------------
+    # SLIDE: Next Steps
+    # ------------------------------------------------------------------
+    slide = prs.slides.add_slide(blank_layout)
+    _set_slide_bg(slide)
+    _slide_title_bar(slide, "Recommended Next Steps")
+
+    steps = [
+        ("1", "Approve Phase 1 Quick Wins",
+         "Start with the highest-impact, lowest-effort items identified in this assessment."),
+        ("2", "Schedule Kickoff Meeting",
+         "Align the project team and define success metrics for each automation."),
+        ("3", "Begin Implementation",
+         "Target 2-4 week delivery for the first automation, with iterative rollout."),
+        ("4", "Measure & Iterate",
+         "Track time savings against baseline and expand to Phase 2 strategic initiatives."),
+    ]
+
+    # Every step is a number badge plus title/description text boxes; build all
+    # of them as markup and add them to the slide with a single parse.
+    shape_id = slide.shapes._next_shape_id
+    step_shapes = []
+    y_offset = Inches(1.8)
+    for num, title, desc in steps:
+        step_shapes.append(_badge_xml(shape_id, Inches(0.9), y_offset, Inches(0.45), num))
+        step_shapes.append(_textbox_xml(shape_id + 1, Inches(1.6), y_offset - Inches(0.05),
+                                        Inches(10), Inches(0.4),
+                                        title, font_size=20, colour=_WHITE, bold=True))
+        step_shapes.append(_textbox_xml(shape_id + 2, Inches(1.6), y_offset + Inches(0.35),
+                                        Inches(10), Inches(0.4),
+                                        desc, font_size=14, colour=_LIGHT_GREY))
+        shape_id += 3
+        y_offset += Inches(1.2)
+    _append_shapes(slide, step_shapes)
+
+    # Footer on last slide
+    _add_textbox(slide, Inches(0.8), SLIDE_H - Inches(0.7), Inches(11), Inches(0.4),
+                 "GVRN-AI  |  AI Audit Framework  |  Confidential",
+                 font_size=11, colour=_MID_GREY, alignment=PP_ALIGN.CENTER)
+
+    # ------------------------------------------------------------------
+    # Save
+    # ------------------------------------------------------------------
+    prs.save(output_path if hasattr(output_path, "write") else str(output_path))
+    return output_path